@@ -2,14 +2,17 @@
 # -*- coding: utf-8 -*-
 
 # --- Silence early SyntaxWarning from peutils (must be the very first lines) ---
+import sys as _sys
 import warnings as _w
+if "peutils" not in _sys.modules:
+    # pre-import under a scoped filter so later imports are no-ops (compiled once, cached in sys.modules)
+    with _w.catch_warnings():
+        _w.simplefilter("ignore", SyntaxWarning)
+        try:
+            import peutils
+        except Exception:
+            pass
 _w.filterwarnings("ignore", category=SyntaxWarning, module=r"^peutils$")
-# fallback, falls die Modul-Filterung mal nicht greift:
-_w.filterwarnings("ignore", message=r"invalid escape sequence .*", category=SyntaxWarning)
-try:
-    import peutils  # pre-import under active filter so later imports are no-ops
-except Exception:
-    pass
 # --- end ---
 
 import os
@@ -18,11 +21,17 @@ import re
 import ast
 import json
 import shlex
-import queue
+import collections
 import shutil
+import signal
+import selectors
 import threading
 import subprocess
 import sysconfig
+import string
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -38,18 +47,112 @@ except Exception:  # pragma: no cover
 
 import importlib.util
 
+try:
+    import orjson  # optional: schnelleres (De-)Serialisieren der Buildprofile
+except Exception:  # pragma: no cover
+    orjson = None
+
 
 APP_TITLE = "Smart PyInstaller Builder"
 PROFILE_SUFFIX = ".buildprofile.json"
 AUTO_DATA_DIRS = ["assets", "data", "resources", "templates", "static", "config", "images", "locale"]
-FILE_EXT_PATTERN = re.compile(
-    r"""(?P<path>[A-Za-z0-9_\-./\\:]+?\.(?:csv|tsv|xlsx|xls|json|yaml|yml|ini|txt|png|jpg|jpeg|gif|svg|ico|
-    qml|ui|html|css|toml|md|db|sqlite|ttf|otf|xml|jinja2|jinja|mo|po))""",
-    re.IGNORECASE | re.VERBOSE,
-)
+DATA_FILE_EXTS = frozenset({
+    "csv", "tsv", "xlsx", "xls", "json", "yaml", "yml", "ini", "txt", "png", "jpg", "jpeg", "gif", "svg", "ico",
+    "qml", "ui", "html", "css", "toml", "md", "db", "sqlite", "ttf", "otf", "xml", "jinja2", "jinja", "mo", "po",
+})
+# eine Erfassung + Set-Lookup statt 30-facher Alternation pro Position
+FILE_EXT_PATTERN = re.compile(r"(?P<path>[A-Za-z0-9_\-./\\:]+\.(?P<ext>[A-Za-z0-9]{1,8}))")
+_STDLIB_PATH = Path(sysconfig.get_paths()["stdlib"]).resolve()
+_VER_RE = re.compile(r"\d+", re.ASCII)
+_SAFE_ARG_MATCH = re.compile(r"[\w@%+=:,./-]+", re.ASCII).fullmatch
+LOG_POLL_MS = 33        # ~30 Hz
+LOG_BUFFER_MAX = 5000   # ausstehende Log-Einträge; bei Überlauf fallen die ältesten weg (wird gemeldet)
+SCAN_SKIP_DIRS = frozenset({".git", "__pycache__", ".venv", "venv", "node_modules"})
 HEAVY_LIBS = {"matplotlib", "sklearn", "cv2", "PIL", "Pillow", "nltk", "spacy", "torch", "transformers",
               "openpyxl", "pydantic", "jinja2", "yaml", "cryptography", "numba", "scipy"}
 
+# Vorlage für --version-file; Werte werden vor dem Einsetzen mit _escape_version_str maskiert
+VERSION_INFO_TEMPLATE = string.Template("""# UTF-8
+# auto-generated by Smart PyInstaller Builder
+VSVersionInfo(
+  ffi=FixedFileInfo(
+    filevers=($vmaj, $vmin, $vpatch, $vbuild),
+    prodvers=($vmaj, $vmin, $vpatch, $vbuild),
+    mask=0x3f, flags=0x0, OS=0x40004, fileType=0x1, subtype=0x0, date=(0, 0)
+  ),
+  kids=[
+    StringFileInfo([StringTable('040904E4', [
+      StringStruct('CompanyName', u'$company'),
+      StringStruct('FileDescription', u'$description'),
+      StringStruct('FileVersion', u'$version'),
+      StringStruct('InternalName', u'$internal_name'),
+      StringStruct('LegalCopyright', u'$copyright'),
+      StringStruct('OriginalFilename', u'$original_filename'),
+      StringStruct('ProductName', u'$product'),
+      StringStruct('ProductVersion', u'$version'),
+      StringStruct('Comments', u'$comments')
+    ])]),
+    VarFileInfo([VarStruct('Translation', [1033, 1200])])
+  ]
+)
+""")
+
+
+def _escape_version_str(value: str) -> str:
+    # Inhalt eines u'...'-Literals: Backslash, Quote und Zeilenumbrüche maskieren
+    return (value.replace("\\", "\\\\").replace("'", "\\'")
+            .replace("\r", "\\r").replace("\n", "\\n"))
+
+
+def _path_default(o):
+    # Rückruf des Encoders nur für nicht-native Typen: Path-Objekte direkt beim Serialisieren umwandeln
+    if isinstance(o, Path):
+        return str(o)
+    raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
+
+
+def _dump_profile_json(profile: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(profile, default=_path_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(profile, indent=2, default=_path_default).encode("utf-8")
+
+
+def _load_profile_json(data: bytes) -> dict:
+    # orjson dekodiert UTF-8-Bytes direkt; json.loads akzeptiert ebenfalls bytes
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _Lazy:
+    """Log-Eintrag, dessen Text erst beim Schreiben ins Log-Widget erzeugt wird."""
+    __slots__ = ("f",)
+
+    def __init__(self, f):
+        self.f = f
+
+    def __str__(self) -> str:
+        return self.f()
+
+
+def _fast_quote(arg: str) -> str:
+    # gleiche Zeichenklasse wie shlex.quote; unkritische Argumente (Flags, Pfade ohne Leerzeichen) unverändert
+    return arg if _SAFE_ARG_MATCH(arg) else shlex.quote(arg)
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    # erst in eine Nachbardatei schreiben, dann per os.replace tauschen: kein halb geschriebenes Profil
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
 
 def data_sep() -> str:
     return ";" if os.name == "nt" else ":"
@@ -59,20 +162,43 @@ def quote_path(p: Path) -> str:
     return str(p)
 
 
+def _iter_py_files(root: str):
+    """
+    Liefert rekursiv alle *.py-Dateien unter root als str-Pfade.
+    os.scandir liefert den Dateityp bereits aus readdir (kein extra stat je Eintrag);
+    versteckte Ordner und SCAN_SKIP_DIRS werden übersprungen.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith(".") and name not in SCAN_SKIP_DIRS:
+                                stack.append(entry.path)
+                        elif name.endswith(".py") and entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=None)
 def get_stdlib_modules() -> set:
+    # Ergebnis ist pro Prozess konstant; Aufrufer dürfen das Set nicht verändern.
     std = set()
     if hasattr(sys, "stdlib_module_names"):  # Py>=3.10
         std.update(sys.stdlib_module_names)
     else:
-        std_paths = {Path(sysconfig.get_paths()["stdlib"]).resolve()}
-        for p in std_paths:
-            if p.exists():
-                for item in p.glob("**/*.py"):
-                    try:
-                        name = item.relative_to(p).with_suffix("").as_posix().replace("/", ".")
-                        std.add(name.split(".")[0])
-                    except Exception:
-                        pass
+        root = str(_STDLIB_PATH)
+        if os.path.isdir(root):
+            for item in _iter_py_files(root):
+                top = os.path.relpath(item, root).split(os.sep, 1)[0]
+                std.add(top[:-3] if top.endswith(".py") else top)
     # Builtins
     try:
         import builtins  # noqa
@@ -83,16 +209,30 @@ def get_stdlib_modules() -> set:
 
 
 def top_level_module(name: str) -> str:
-    return name.split(".")[0] if name else name
+    return name.partition(".")[0]
 
 
+@functools.lru_cache(maxsize=1)
 def packages_distributions_map() -> dict:
+    # teuer (liest RECORD aller Distributionen) – einmal pro Prozess genügt
     try:
         return importlib_metadata.packages_distributions()
     except Exception:
         return {}
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_find_spec(name: str):
+    # find_spec durchsucht sys.path – pro Modulname reicht ein Lauf
+    return importlib.util.find_spec(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_stdlib_origin(origin: str) -> bool:
+    resolved = Path(origin).resolve()
+    return resolved == _STDLIB_PATH or _STDLIB_PATH in resolved.parents
+
+
 def is_third_party(mod: str, stdlib: set, pkg_map: dict) -> bool:
     m = top_level_module(mod)
     if not m or m in stdlib:
@@ -100,87 +240,109 @@ def is_third_party(mod: str, stdlib: set, pkg_map: dict) -> bool:
     if m in pkg_map:
         return True
     try:
-        spec = importlib.util.find_spec(m)
+        spec = _cached_find_spec(m)
         if spec is None or spec.origin in (None, "built-in"):
             return False
-        stdlib_path = Path(sysconfig.get_paths()["stdlib"]).resolve()
-        origin = Path(spec.origin).resolve()
-        return stdlib_path not in origin.parents and origin != stdlib_path
+        return not _is_stdlib_origin(spec.origin)
     except Exception:
         return True
 
 
+def filter_third_party(mods, stdlib: set, pkg_map: dict) -> set:
+    # Mengenoperationen zuerst; find_spec nur für Namen, die weder stdlib noch bekannte Distribution sind
+    candidates = {top_level_module(m) for m in mods} - stdlib
+    candidates.discard("")
+    third_party = candidates & pkg_map.keys()
+    for m in candidates - third_party:
+        if is_third_party(m, stdlib, pkg_map):
+            third_party.add(m)
+    return third_party
+
+
 # ---- FIX: sichere Extraktion von String-Literalen aus AST-Knoten (ohne ast.Str/.s) ----
+_AST_CONSTANT = ast.Constant
+
+
 def _extract_str_constant(node: ast.AST) -> Optional[str]:
     """
     Liefert den String-Wert aus einem AST-Knoten, falls dieser eine String-Konstante ist.
     Auf modernen Pythons (>=3.8) ausschließlich über ast.Constant.
-    Fallback auf ast.Str nur, falls ast.Constant nicht existiert (sehr alte Versionen).
     """
-    Constant = getattr(ast, "Constant", None)
-    if Constant is not None and isinstance(node, Constant):
-        val = getattr(node, "value", None)
-        return val if isinstance(val, str) else None
+    val = node.value if isinstance(node, _AST_CONSTANT) else None
+    return val if isinstance(val, str) else None
 
-    # Fallback nur für sehr alte Pythons; auf modernen führt dies nicht zu DeprecationWarnings
-    if Constant is None:
-        Str = getattr(ast, "Str", None)
-        if Str is not None and isinstance(node, Str):
-            return getattr(node, "s", None)
 
-    return None
+_DYNAMIC_IMPORT_FUNCS = frozenset({"import_module", "__import__"})
+_DYNAMIC_IMPORT_KWARGS = frozenset({"name", "module"})
 
 
-def parse_imports_from_file(py_file: Path) -> tuple[set, set]:
-    imports = set()
-    dynamic = set()
+class _ImportVisitor(ast.NodeVisitor):
+    """Sammelt statische Imports und String-Argumente dynamischer Imports."""
+
+    def __init__(self):
+        self.imports: set[str] = set()
+        self.dynamic: set[str] = set()
+
+    # Hot path: top_level_module() hier inline als str.partition
+    def visit_Import(self, node: ast.Import):
+        imports_add = self.imports.add
+        for alias in node.names:
+            if alias.name:
+                imports_add(alias.name.partition(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.imports.add(node.module.partition(".")[0])
+
+    def visit_Call(self, node: ast.Call):
+        # importlib.import_module("x.y")  oder  __import__("x.y")
+        try:
+            func = node.func
+            if isinstance(func, ast.Attribute):
+                func_name = func.attr
+            elif isinstance(func, ast.Name):
+                func_name = func.id
+            else:
+                func_name = ""
+
+            if func_name in _DYNAMIC_IMPORT_FUNCS:
+                mod = None
+                # Positional arg
+                if node.args:
+                    mod = _extract_str_constant(node.args[0])
+                # Keyword-arg (name=/module=)
+                if mod is None:
+                    for kw in (node.keywords or []):
+                        if kw.arg in _DYNAMIC_IMPORT_KWARGS:
+                            mod = _extract_str_constant(kw.value)
+                            if mod:
+                                break
+                if mod:
+                    self.dynamic.add(mod.partition(".")[0])
+        except Exception:
+            pass
+        # Argumente können weitere Aufrufe enthalten
+        self.generic_visit(node)
+
+
+def _imports_from_source(src: str, filename: str) -> tuple[set, set]:
+    visitor = _ImportVisitor()
     try:
-        src = py_file.read_text(encoding="utf-8", errors="ignore")
-        tree = ast.parse(src, filename=str(py_file))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name:
-                        imports.add(top_level_module(alias.name))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.add(top_level_module(node.module))
-            elif isinstance(node, ast.Call):
-                # importlib.import_module("x.y")  oder  __import__("x.y")
-                try:
-                    func_name = ""
-                    if isinstance(node.func, ast.Attribute):
-                        func_name = node.func.attr
-                    elif isinstance(node.func, ast.Name):
-                        func_name = node.func.id
-
-                    if func_name in {"import_module", "__import__"}:
-                        mod = None
-                        # Positional arg
-                        if node.args:
-                            mod = _extract_str_constant(node.args[0])
-                        # Keyword-arg (name=/module=)
-                        if mod is None:
-                            for kw in (node.keywords or []):
-                                if kw.arg in {"name", "module"}:
-                                    mod = _extract_str_constant(kw.value)
-                                    if mod:
-                                        break
-                        if mod:
-                            dynamic.add(top_level_module(mod))
-                except Exception:
-                    pass
+        visitor.visit(ast.parse(src, filename=filename))
     except Exception:
         pass
-    return imports, dynamic
+    return visitor.imports, visitor.dynamic
 
 
-def find_literal_files(py_file: Path, project_root: Path) -> set[Path]:
-    found = set()
+def _literal_candidates_from_source(src: str, py_file: Path) -> set[Path]:
+    candidates = set()
     try:
-        src = py_file.read_text(encoding="utf-8", errors="ignore")
-        for m in FILE_EXT_PATTERN.finditer(src):
-            raw = m.group("path")
+        # gleiche Literale (z.B. "config.json") nur einmal auflösen
+        raws = {
+            m.group("path") for m in FILE_EXT_PATTERN.finditer(src)
+            if m.group("ext").lower() in DATA_FILE_EXTS
+        }
+        for raw in raws:
             if not raw:
                 continue
             # normalize
@@ -188,6 +350,16 @@ def find_literal_files(py_file: Path, project_root: Path) -> set[Path]:
             # relative to script file
             if not candidate.is_absolute():
                 candidate = (py_file.parent / candidate).resolve()
+            candidates.add(candidate)
+    except Exception:
+        pass
+    return candidates
+
+
+def _existing_literal_files(candidates, project_root: Path) -> set[Path]:
+    found = set()
+    for candidate in candidates:
+        try:
             if candidate.exists() and candidate.is_file():
                 try:
                     # include only files within project root if possible; otherwise include by basename
@@ -197,26 +369,85 @@ def find_literal_files(py_file: Path, project_root: Path) -> set[Path]:
                         found.add(candidate)
                 except Exception:
                     found.add(candidate)
-    except Exception:
-        pass
+        except Exception:
+            pass
     return found
 
 
+def _literal_files_from_source(src: str, py_file: Path, project_root: Path) -> set[Path]:
+    return _existing_literal_files(_literal_candidates_from_source(src, py_file), project_root)
+
+
+def _read_source(py_file: Path) -> Optional[str]:
+    try:
+        return py_file.read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return None
+
+
+def parse_imports_from_file(py_file: Path) -> tuple[set, set]:
+    src = _read_source(py_file)
+    if src is None:
+        return set(), set()
+    return _imports_from_source(src, str(py_file))
+
+
+def find_literal_files(py_file: Path, project_root: Path) -> set[Path]:
+    src = _read_source(py_file)
+    if src is None:
+        return set()
+    return _literal_files_from_source(src, py_file, project_root)
+
+
+# Pfad -> ((st_mtime_ns, st_size), (imports, dynamic, literal_candidates))
+_AST_SCAN_CACHE: dict[str, tuple[tuple[int, int], tuple[frozenset, frozenset, frozenset]]] = {}
+
+
+def _scan_file(py_file: Path) -> tuple[frozenset, frozenset, frozenset]:
+    """
+    Liest und analysiert eine Datei einmal; Regex-Suche und ast.parse laufen auf demselben String.
+    Liefert Imports, dynamische Imports und aufgelöste Literal-Kandidaten (noch ohne Existenzprüfung).
+    Unveränderte Dateien (gleiche mtime/Größe) werden aus _AST_SCAN_CACHE bedient.
+    """
+    key = str(py_file)
+    try:
+        st = os.stat(key)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return frozenset(), frozenset(), frozenset()
+    cached = _AST_SCAN_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    src = _read_source(py_file)
+    if src is None:
+        return frozenset(), frozenset(), frozenset()
+    imps, dyn = _imports_from_source(src, key)
+    result = (frozenset(imps), frozenset(dyn), frozenset(_literal_candidates_from_source(src, py_file)))
+    _AST_SCAN_CACHE[key] = (stamp, result)
+    return result
+
+
 def scan_project(script_path: Path, scan_all_py: bool) -> dict:
     project_root = script_path.parent.resolve()
-    files = [script_path]
+    unique_files = {script_path.resolve()}
     if scan_all_py:
-        for p in project_root.rglob("*.py"):
-            if p.is_file():
-                files.append(p.resolve())
+        # project_root ist bereits aufgelöst -> die gelieferten Pfade sind absolut
+        unique_files.update(Path(p) for p in _iter_py_files(str(project_root)))
     imports = set()
     dynamic = set()
-    literal_files = set()
-    for f in set(files):
-        imps, dyn = parse_imports_from_file(f)
-        imports |= imps
-        dynamic |= dyn
-        literal_files |= find_literal_files(f, project_root)
+    candidates = set()
+    # read_text gibt den GIL frei, ast.parse läuft in C -> Threads skalieren hier gut
+    workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(unique_files)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_file, f) for f in unique_files]
+        for fut in as_completed(futures):
+            imps, dyn, cands = fut.result()
+            imports |= imps
+            dynamic |= dyn
+            candidates |= cands
+    # Existenz projektweit nur einmal je Kandidat prüfen – bewusst bei jedem Scan,
+    # da Datendateien unabhängig vom (gecachten) Quelltext hinzukommen oder verschwinden
+    literal_files = _existing_literal_files(candidates, project_root)
     return {
         "project_root": project_root,
         "imports": imports,
@@ -237,18 +468,54 @@ def auto_data_dirs(project_root: Path) -> list[tuple[Path, str]]:
 def map_add_data_entries(paths: list[Path], project_root: Path) -> list[tuple[Path, str]]:
     mapped = []
     for p in paths:
-        p = p.resolve()
+        # erkannte Literal-Dateien sind bereits aufgelöst -> realpath-Syscall sparen
+        if not p.is_absolute():
+            p = p.resolve()
         try:
             rel = p.relative_to(project_root)
             dest = str(rel.parent) if p.is_file() else str(rel)
-            if dest == ".":
-                dest = "."
         except Exception:
-            dest = p.name if p.is_file() else p.name
+            dest = p.name
         mapped.append((p, dest))
     return mapped
 
 
+@functools.lru_cache(maxsize=8)
+def assemble_datas(
+    manual_datas: tuple[tuple[Path, str], ...],
+    literal_files: frozenset,
+    project_root: Path,
+    include_auto_dirs: bool,
+    root_mtime_ns: int,
+) -> tuple[tuple[Path, str], ...]:
+    """
+    Kombiniert manuelle Daten, erkannte Literal-Dateien und Standard-Datenordner (ohne Duplikate).
+    root_mtime_ns dient nur als Cache-Schlüssel, damit neue Datenordner erkannt werden.
+    """
+    result: list[tuple[Path, str]] = []
+    seen: set[tuple[str, str]] = set()
+
+    def add(p: Path, dest: str):
+        key = (str(p), dest)
+        if key not in seen:
+            seen.add(key)
+            result.append((p, dest))
+
+    # manual
+    for p, dest in manual_datas:
+        add(p, dest)
+
+    # literal files
+    for p, dest in map_add_data_entries(sorted(literal_files), project_root):
+        add(p, dest)
+
+    # auto dirs
+    if include_auto_dirs:
+        for p, dest in auto_data_dirs(project_root):
+            add(p, dest)
+    return tuple(result)
+
+
 def suggest_collect_all(imports: set) -> list[str]:
     s = set()
     for m in imports:
@@ -294,6 +561,96 @@ def _with_peutils_syntaxwarning_filter_env(env: Optional[dict] = None) -> dict:
     return env
 
 
+@functools.lru_cache(maxsize=1)
+def _subprocess_env() -> dict:
+    # os.environ ändert sich in der GUI-Sitzung nicht; Popen liest das Mapping nur
+    return _with_peutils_syntaxwarning_filter_env()
+
+
+def _clean_log_block(text: str) -> str:
+    return "\n".join(line.rstrip() for line in text.split("\n"))
+
+
+def _iter_pipe_blocks(stream, chunk_size: int = 65536, cancel_fd: Optional[int] = None):
+    """
+    Liest eine ungepufferte Pipe blockweise per os.read und liefert je Lesevorgang einen
+    Log-Eintrag mit allen darin vollständigen Zeilen. Viel Ausgabe ergibt so wenige große Einträge,
+    und nichts bleibt liegen, solange der Kindprozess schweigt.
+    Dekodiert wird nur der Teil bis zum letzten Zeilenumbruch, ein Zeilenrest bleibt im Puffer.
+    Mit cancel_fd (Lese-Ende einer Self-Pipe, nur POSIX) wartet ein Selector zusätzlich
+    auf ein Abbruchsignal; sobald dort etwas ankommt, endet die Iteration.
+    """
+    fd = stream.fileno()
+    sel = None
+    if cancel_fd is not None:
+        sel = selectors.DefaultSelector()
+        sel.register(fd, selectors.EVENT_READ, "out")
+        sel.register(cancel_fd, selectors.EVENT_READ, "cancel")
+    buf = bytearray()
+    try:
+        while True:
+            if sel is not None:
+                ready = {key.data for key, _ in sel.select()}
+                if "cancel" in ready:
+                    return
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                break
+            buf += chunk
+            nl = buf.rfind(b"\n")
+            if nl < 0:
+                continue
+            block = bytes(buf[:nl])
+            del buf[:nl + 1]
+            yield _clean_log_block(block.decode("utf-8", "replace"))
+        if buf:
+            yield _clean_log_block(buf.decode("utf-8", "replace"))
+    finally:
+        if sel is not None:
+            sel.close()
+
+
+def _terminate_process(p: subprocess.Popen, timeout: float = 5.0):
+    """
+    Beendet einen mit _new_process_group_kwargs() gestarteten Prozess samt Prozessgruppe:
+    POSIX: SIGTERM an die Gruppe, nach timeout Sekunden SIGKILL.
+    Windows: CTRL_BREAK_EVENT an die Gruppe, nach timeout Sekunden taskkill /T (Prozessbaum)
+    und TerminateProcess. Kinder, die einen bereits beendeten Elternprozess überleben,
+    erreicht taskkill /T dort nicht mehr.
+    Scheitert das weiche Signal (unter pythonw.exe ohne Konsole wirft CTRL_BREAK_EVENT OSError),
+    wird sofort hart beendet.
+    """
+    try:
+        if os.name == "nt":
+            p.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(p.pid, signal.SIGTERM)
+        p.wait(timeout)
+        return
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(p.pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            p.kill()
+        else:
+            os.killpg(p.pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _new_process_group_kwargs() -> dict:
+    """
+    Popen-Argumente, die den Kindprozess in eine eigene Prozessgruppe/Session legen.
+    So kann _terminate_process den Build samt Gruppe abbrechen
+    (CTRL_BREAK_EVENT bzw. Signal an die Gruppe), ohne die GUI mitzutreffen.
+    """
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
 def install_pyinstaller(log_cb) -> bool:
     try:
         log_cb("Installiere/aktualisiere PyInstaller …")
@@ -302,12 +659,11 @@ def install_pyinstaller(log_cb) -> bool:
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            env=_with_peutils_syntaxwarning_filter_env(),
+            bufsize=0,
+            env=_subprocess_env(),
         )
-        for line in p.stdout:  # type: ignore
-            log_cb(line.rstrip())
+        for block in _iter_pipe_blocks(p.stdout):
+            log_cb(block)
         rc = p.wait()
         if rc == 0:
             log_cb("PyInstaller installiert.")
@@ -379,13 +735,49 @@ def open_folder(path: Path):
 
 
 class BuilderGUI:
+    # Profilfelder, die direkt an Tk-Variablen hängen: (Abschnitt, Schlüssel, Attribut, Typ, Default).
+    # Abschnitt None = oberste Ebene; der Typ wird beim Speichern und Laden angewendet.
+    _PROFILE_FIELDS = (
+        (None, "script", "script_var", str.strip, ""),
+        (None, "name", "name_var", str.strip, ""),
+        (None, "icon", "icon_var", str.strip, ""),
+        (None, "onefile", "onefile_var", bool, True),
+        (None, "windowed", "windowed_var", bool, False),
+        (None, "clean", "clean_var", bool, True),
+        (None, "scan_all", "scan_all_var", bool, True),
+        (None, "auto_data_dirs", "auto_data_dirs_var", bool, True),
+        (None, "collect_all", "collect_all_var", bool, True),
+        (None, "noupx", "noupx_var", bool, True),
+        (None, "runtime_tmpdir", "runtime_tmpdir_var", str, ""),
+        ("profile_meta", "use_versioninfo", "use_versioninfo_var", bool, True),
+        ("profile_meta", "publisher", "publisher_var", str, ""),
+        ("profile_meta", "product", "product_var", str, ""),
+        ("profile_meta", "version", "version_var", str, "1.0.0"),
+        ("profile_meta", "description", "desc_var", str, ""),
+        ("profile_meta", "copyright", "copyright_var", str, ""),
+    )
+
     def __init__(self, root: tk.Tk):
         self.root = root
         root.title(APP_TITLE)
         root.geometry("1080x820")
 
-        self.log_queue = queue.Queue()
+        # Worker-Threads hängen nur Strings an (unter _log_lock);
+        # das Widget schreibt ausschließlich _poll_log im Tk-Thread
+        self._log_buf: collections.deque = collections.deque(maxlen=LOG_BUFFER_MAX)
+        # verworfene Einträge zählen, damit _poll_log die Lücke im Log anzeigen kann
+        self._log_dropped = 0
+        self._log_lock = threading.Lock()
         self.build_thread = None
+        # gesetzt = kein Build aktiv; _run_build setzt es im finally wieder
+        self._build_done = threading.Event()
+        self._build_done.set()
+        # Abbruch eines laufenden Builds (siehe _cancel_build/_run_build)
+        self._cancel_event = threading.Event()
+        self._cancel_w: Optional[int] = None
+        # schützt _cancel_w: Schreiben (Tk-Thread) und Schließen (Worker) schließen sich aus
+        self._cancel_lock = threading.Lock()
+        self._build_proc: Optional[subprocess.Popen] = None
 
         self.script_var = tk.StringVar()
         self.icon_var = tk.StringVar()
@@ -411,6 +803,16 @@ class BuilderGUI:
         self.extra_paths: list[Path] = []
         self.manual_datas: list[tuple[Path, str]] = []
         self.manual_hidden: list[str] = []
+        # Listbox-Zeile -> Index in manual_datas (None für auto-Einträge)
+        self._datas_row_index: list[Optional[int]] = []
+        # zuletzt angezeigte Listbox-Inhalte (siehe _set_listbox_items)
+        self._listbox_items: dict[str, list[str]] = {}
+        # Profilpfad -> (st_mtime_ns, st_size, geparstes Profil)
+        self._profile_cache: dict[str, tuple[int, int, dict]] = {}
+        # Hash (Zielpfad + Inhalt) sowie (st_mtime_ns, st_size) des zuletzt geschriebenen Profils
+        self._last_profile_write: Optional[tuple[bytes, int, int]] = None
+        # True während _load_profile: Folgearbeiten (Listen-Refresh) erst nach dem Laden einmalig ausführen
+        self._bulk_loading = False
 
         self.detected_imports: set[str] = set()
         self.detected_dynamic: set[str] = set()
@@ -521,6 +923,7 @@ class BuilderGUI:
         ttk.Button(act, text="Analysieren", command=self._analyze).pack(side="left")
         ttk.Button(act, text="PyInstaller installieren/aktualisieren", command=self._install_pyinstaller).pack(side="left")
         ttk.Button(act, text="Build starten", command=self._build).pack(side="left")
+        ttk.Button(act, text="Build abbrechen", command=self._cancel_build).pack(side="left")
         ttk.Button(act, text="Dist öffnen", command=self._open_dist).pack(side="left")
         ttk.Button(act, text="Profil speichern", command=self._save_profile).pack(side="right")
         ttk.Button(act, text="Profil laden", command=self._load_profile).pack(side="right")
@@ -567,14 +970,14 @@ class BuilderGUI:
         self._refresh_datas_list()
 
     def _remove_selected_datas(self):
-        sel = list(self.datas_list.curselection())[::-1]
-        for i in sel:
-            item = self.datas_list.get(i)
-            # find tuple to remove
-            for t in list(self.manual_datas):
-                if item.startswith(str(t[0])):
-                    self.manual_datas.remove(t)
-                    break
+        backing = {
+            self._datas_row_index[row]
+            for row in self.datas_list.curselection()
+            if row < len(self._datas_row_index) and self._datas_row_index[row] is not None
+        }
+        # absteigend löschen, damit die übrigen Indizes gültig bleiben
+        for i in sorted(backing, reverse=True):
+            del self.manual_datas[i]
         self._refresh_datas_list()
 
     def _add_extra_path(self):
@@ -605,48 +1008,72 @@ class BuilderGUI:
                 pass
         self._refresh_imports_list()
 
+    def _set_listbox_items(self, key: str, listbox: tk.Listbox, items: list[str]):
+        # unveränderte Listen nicht neu aufbauen; sonst alle Zeilen mit einem insert-Aufruf setzen
+        if self._listbox_items.get(key) == items:
+            return
+        listbox.delete(0, tk.END)
+        if items:
+            listbox.insert(tk.END, *items)
+        self._listbox_items[key] = items
+
+    def _refresh_all(self):
+        self._refresh_imports_list()
+        self._refresh_datas_list()
+        self._refresh_paths_list()
+
     def _refresh_imports_list(self):
-        self.imports_list.delete(0, tk.END)
-        for m in sorted(self.detected_imports | self.detected_dynamic | set(self.manual_hidden)):
-            self.imports_list.insert(tk.END, m)
+        items = sorted(self.detected_imports | self.detected_dynamic | set(self.manual_hidden))
+        self._set_listbox_items("imports", self.imports_list, items)
 
     def _refresh_datas_list(self):
-        self.datas_list.delete(0, tk.END)
-        for p, dest in self.manual_datas:
-            self.datas_list.insert(tk.END, f"{p}  ->  {dest}")
+        items: list[str] = []
+        row_index: list[Optional[int]] = []
+        for i, (p, dest) in enumerate(self.manual_datas):
+            items.append(f"{p}  ->  {dest}")
+            row_index.append(i)
         # also show auto-detected literal files (read-only visual)
         for f in sorted(self.detected_literal_files):
-            self.datas_list.insert(tk.END, f"{f}  (auto)")
+            items.append(f"{f}  (auto)")
+            row_index.append(None)
 
         if self.auto_data_dirs_var.get() and self.script_var.get():
             project_root = Path(self.script_var.get()).parent.resolve()
             for p, dest in auto_data_dirs(project_root):
-                self.datas_list.insert(tk.END, f"{p}  ->  {dest}  (auto-dir)")
+                items.append(f"{p}  ->  {dest}  (auto-dir)")
+                row_index.append(None)
+        self._set_listbox_items("datas", self.datas_list, items)
+        self._datas_row_index = row_index
 
     def _refresh_paths_list(self):
-        self.paths_list.delete(0, tk.END)
-        for p in self.extra_paths:
-            self.paths_list.insert(tk.END, str(p))
+        items = [str(p) for p in self.extra_paths]
         if self.collect_all_var.get():
             if self.detected_collect_all:
-                self.paths_list.insert(tk.END, "--- Collect-All-Vorschläge ---")
-                for pkg in self.detected_collect_all:
-                    self.paths_list.insert(tk.END, f"--collect-all {pkg}")
+                items.append("--- Collect-All-Vorschläge ---")
+                items.extend(f"--collect-all {pkg}" for pkg in self.detected_collect_all)
+        self._set_listbox_items("paths", self.paths_list, items)
 
-    def _log(self, text: str):
-        self.log_queue.put(text)
+    def _log(self, text: "str | _Lazy"):
+        with self._log_lock:
+            buf = self._log_buf
+            if len(buf) == buf.maxlen:
+                self._log_dropped += 1
+            buf.append(text)
 
     def _poll_log(self):
-        try:
-            while True:
-                line = self.log_queue.get_nowait()
-                self.log.configure(state="normal")
-                self.log.insert(tk.END, line + "\n")
-                self.log.see(tk.END)
-                self.log.configure(state="disabled")
-        except queue.Empty:
-            pass
-        self.root.after(80, self._poll_log)
+        # alles Anstehende abholen und mit einem einzigen insert/see ins Widget schreiben
+        with self._log_lock:
+            lines = list(self._log_buf)
+            self._log_buf.clear()
+            dropped, self._log_dropped = self._log_dropped, 0
+        if dropped:
+            lines.insert(0, f"… {dropped} Log-Einträge verworfen (GUI war ausgelastet)")
+        if lines:
+            self.log.configure(state="normal")
+            self.log.insert(tk.END, "\n".join(map(str, lines)) + "\n")
+            self.log.see(tk.END)
+            self.log.configure(state="disabled")
+        self.root.after(LOG_POLL_MS, self._poll_log)
 
     def _install_pyinstaller(self):
         threading.Thread(target=self._install_pyinstaller_bg, daemon=True).start()
@@ -666,15 +1093,8 @@ class BuilderGUI:
         stdlib = get_stdlib_modules()
         pkg_map = packages_distributions_map()
 
-        third_party = set()
-        for m in sorted(res["imports"]):
-            if is_third_party(m, stdlib, pkg_map):
-                third_party.add(m)
-
-        dynamic = set()
-        for m in sorted(res["dynamic_imports"]):
-            if is_third_party(m, stdlib, pkg_map):
-                dynamic.add(m)
+        third_party = filter_third_party(res["imports"], stdlib, pkg_map)
+        dynamic = filter_third_party(res["dynamic_imports"], stdlib, pkg_map)
 
         self.detected_imports = third_party
         self.detected_dynamic = dynamic
@@ -685,30 +1105,25 @@ class BuilderGUI:
         if self.detected_collect_all:
             self._log("Collect-All-Empfehlungen: " + ", ".join(self.detected_collect_all))
 
-        self._refresh_imports_list()
-        self._refresh_datas_list()
-        self._refresh_paths_list()
+        if self._bulk_loading:
+            return
+        self._refresh_all()
 
     def _assemble_datas(self) -> list[tuple[Path, str]]:
-        result: list[tuple[Path, str]] = []
         script = Path(self.script_var.get()).resolve()
         project_root = script.parent
-
-        # manual
-        result.extend(self.manual_datas)
-
-        # literal files
-        mapped_literal = map_add_data_entries(list(self.detected_literal_files), project_root)
-        for t in mapped_literal:
-            if t not in result:
-                result.append(t)
-
-        # auto dirs
-        if self.auto_data_dirs_var.get():
-            for p, dest in auto_data_dirs(project_root):
-                if (p, dest) not in result:
-                    result.append((p, dest))
-        return result
+        try:
+            # neue/entfernte Standard-Datenordner ändern die mtime des Projektordners
+            root_mtime_ns = os.stat(project_root).st_mtime_ns
+        except OSError:
+            root_mtime_ns = 0
+        return list(assemble_datas(
+            tuple(self.manual_datas),
+            frozenset(self.detected_literal_files),
+            project_root,
+            bool(self.auto_data_dirs_var.get()),
+            root_mtime_ns,
+        ))
 
     def _assemble_hidden_imports(self) -> list[str]:
         # combine detected + manual
@@ -718,38 +1133,28 @@ class BuilderGUI:
     # --- NEW: Versioninfo-Datei erzeugen (Windows) ---------------------------
     @staticmethod
     def _parse_version_tuple(s: str) -> tuple[int, int, int, int]:
-        parts = [p for p in re.split(r"[^\d]+", s) if p][:4]
-        nums = [int(x) for x in parts[:4]]
-        return tuple((nums + [0, 0, 0, 0])[:4])  # (major, minor, patch, build)
+        nums = [int(x) for x in _VER_RE.findall(s)[:4]]
+        nums += [0] * (4 - len(nums))
+        return tuple(nums)  # (major, minor, patch, build)
 
     def _write_version_file(self, exe_name: str) -> Optional[Path]:
         if os.name != "nt" or not self.use_versioninfo_var.get():
             return None
         vmaj, vmin, vpatch, vbuild = self._parse_version_tuple(self.version_var.get() or "1.0.0.0")
-        content = f'''# UTF-8
-# auto-generated by Smart PyInstaller Builder
-VSVersionInfo(
-  ffi=FixedFileInfo(
-    filevers=({vmaj}, {vmin}, {vpatch}, {vbuild}),
-    prodvers=({vmaj}, {vmin}, {vpatch}, {vbuild}),
-    mask=0x3f, flags=0x0, OS=0x40004, fileType=0x1, subtype=0x0, date=(0, 0)
-  ),
-  kids=[
-    StringFileInfo([StringTable('040904E4', [
-      StringStruct('CompanyName', u'{self.publisher_var.get()}'),
-      StringStruct('FileDescription', u'{self.desc_var.get() or exe_name}'),
-      StringStruct('FileVersion', u'{self.version_var.get()}'),
-      StringStruct('InternalName', u'{exe_name}'),
-      StringStruct('LegalCopyright', u'{self.copyright_var.get()}'),
-      StringStruct('OriginalFilename', u'{exe_name}.exe'),
-      StringStruct('ProductName', u'{self.product_var.get() or exe_name}'),
-      StringStruct('ProductVersion', u'{self.version_var.get()}'),
-      StringStruct('Comments', u'Build: {datetime.now().isoformat(timespec="seconds")}')
-    ])]),
-    VarFileInfo([VarStruct('Translation', [1033, 1200])])
-  ]
-)
-'''
+        fields = {
+            "company": self.publisher_var.get(),
+            "description": self.desc_var.get() or exe_name,
+            "version": self.version_var.get(),
+            "internal_name": exe_name,
+            "copyright": self.copyright_var.get(),
+            "original_filename": f"{exe_name}.exe",
+            "product": self.product_var.get() or exe_name,
+            "comments": f"Build: {datetime.now().isoformat(timespec='seconds')}",
+        }
+        content = VERSION_INFO_TEMPLATE.substitute(
+            {k: _escape_version_str(v) for k, v in fields.items()},
+            vmaj=vmaj, vmin=vmin, vpatch=vpatch, vbuild=vbuild,
+        )
         dst = Path(self.script_var.get()).parent / f"{exe_name}.versioninfo.txt"
         dst.write_text(content, encoding="utf-8")
         return dst
@@ -792,39 +1197,94 @@ VSVersionInfo(
             runtime_tmpdir=(self.runtime_tmpdir_var.get().strip() or None),
         )
         self._log("Starte Build:")
-        self._log(" ".join(shlex.quote(x) for x in cmd))
+        self._log(_Lazy(lambda: " ".join(_fast_quote(x) for x in cmd)))
         self._start_build_thread(cmd, script.parent)
 
     def _start_build_thread(self, cmd: list[str], cwd: Path):
-        if self.build_thread and self.build_thread.is_alive():
+        if not self._build_done.is_set():
             messagebox.showwarning(APP_TITLE, "Build läuft bereits.")
             return
+        self._build_done.clear()
         self.build_thread = threading.Thread(target=self._run_build, args=(cmd, cwd), daemon=True)
-        self.build_thread.start()
+        try:
+            self.build_thread.start()
+        except Exception:
+            self._build_done.set()
+            raise
 
     def _run_build(self, cmd: list[str], cwd: Path):
+        self._cancel_event.clear()
+        # POSIX: Self-Pipe weckt den Selector im Lese-Loop; Windows kann Pipes nicht selektieren,
+        # dort beendet _cancel_build die Prozessgruppe direkt und der Lese-Loop endet mit EOF
+        cancel_r = None
+        if os.name != "nt":
+            cancel_r, cancel_w = os.pipe()
+            with self._cancel_lock:
+                self._cancel_w = cancel_w
         try:
+            # Binär und ungepuffert lesen, nur vollständige Zeilen dekodieren (kein TextIOWrapper im Pfad);
+            # "replace" statt strict, damit fremdkodierte Ausgaben den Build-Log nicht abbrechen
             p = subprocess.Popen(
                 cmd,
                 cwd=str(cwd),
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                env=_with_peutils_syntaxwarning_filter_env(),
+                bufsize=0,
+                env=_subprocess_env(),
+                **_new_process_group_kwargs(),
             )
-            for line in p.stdout:  # type: ignore
-                self._log(line.rstrip())
+            self._build_proc = p
+            for block in _iter_pipe_blocks(p.stdout, cancel_fd=cancel_r):
+                self._log(block)
+            # Abbruchzweig nur, wenn der Prozess noch läuft; ein bereits beendeter Build
+            # (EOF vor dem Klick oder wirkungsloser Abbruch) wird regulär ausgewertet
+            if self._cancel_event.is_set() and p.poll() is None:
+                _terminate_process(p)
+                p.wait()
+                p.stdout.close()  # type: ignore
+                self._log("Build abgebrochen.")
+                return
             rc = p.wait()
             if rc == 0:
                 self._log("Build erfolgreich.")
                 dist = cwd / "dist"
                 if dist.exists():
                     self._log(f"Ausgabe: {dist}")
+            elif self._cancel_event.is_set():
+                # Windows: die Gruppe wurde von _cancel_build beendet, der Lese-Loop endete mit EOF
+                self._log(f"Build abgebrochen. Rückgabecode {rc}.")
             else:
                 self._log(f"Build fehlgeschlagen. Rückgabecode {rc}.")
         except Exception as e:
             self._log(f"Build-Fehler: {e}")
+        finally:
+            self._build_proc = None
+            with self._cancel_lock:
+                cancel_w, self._cancel_w = self._cancel_w, None
+                if cancel_w is not None:
+                    os.close(cancel_w)
+            if cancel_r is not None:
+                os.close(cancel_r)
+            self._build_done.set()
+
+    def _cancel_build(self):
+        p = self._build_proc
+        if p is None:
+            self._log("Kein Build aktiv.")
+            return
+        self._log("Breche Build ab …")
+        self._cancel_event.set()
+        if os.name == "nt":
+            # wartet ggf. bis zum Timeout – nicht im Tk-Thread
+            threading.Thread(target=_terminate_process, args=(p,), daemon=True).start()
+            return
+        with self._cancel_lock:
+            cancel_w = self._cancel_w
+            if cancel_w is not None:
+                try:
+                    os.write(cancel_w, b"x")
+                except OSError:
+                    pass
 
     def _open_dist(self):
         script = self.script_var.get().strip()
@@ -836,38 +1296,43 @@ VSVersionInfo(
         else:
             messagebox.showinfo(APP_TITLE, "Kein dist-Ordner gefunden.")
 
+    def _profile_snapshot(self) -> dict:
+        # jede Tk-Variable genau einmal lesen (ein Tcl-Aufruf je Feld)
+        return {key: getattr(self, attr).get() for _section, key, attr, _caster, _default in self._PROFILE_FIELDS}
+
     def _save_profile(self):
-        script = self.script_var.get().strip()
+        values = self._profile_snapshot()
+        script = values["script"].strip()
         if not script:
             messagebox.showerror(APP_TITLE, "Kein Script gewählt.")
             return
-        profile = {
-            "script": script,
-            "name": self.name_var.get().strip(),
-            "icon": self.icon_var.get().strip(),
-            "onefile": self.onefile_var.get(),
-            "windowed": self.windowed_var.get(),
-            "clean": self.clean_var.get(),
-            "scan_all": self.scan_all_var.get(),
-            "auto_data_dirs": self.auto_data_dirs_var.get(),
-            "collect_all": self.collect_all_var.get(),
-            "extra_paths": [str(p) for p in self.extra_paths],
-            "manual_datas": [(str(p), dest) for p, dest in self.manual_datas],
-            "manual_hidden": list(self.manual_hidden),
-            # NEW
-            "noupx": self.noupx_var.get(),
-            "runtime_tmpdir": self.runtime_tmpdir_var.get(),
-            "profile_meta": {
-                "use_versioninfo": self.use_versioninfo_var.get(),
-                "publisher": self.publisher_var.get(),
-                "product": self.product_var.get(),
-                "version": self.version_var.get(),
-                "description": self.desc_var.get(),
-                "copyright": self.copyright_var.get(),
-            },
-        }
+        profile: dict = {}
+        for section, key, _attr, caster, _default in self._PROFILE_FIELDS:
+            target = profile if section is None else profile.setdefault(section, {})
+            target[key] = caster(values[key])
+        # Path-Objekte wandelt _path_default während des Encodings um
+        profile["extra_paths"] = self.extra_paths
+        profile["manual_datas"] = self.manual_datas
+        profile["manual_hidden"] = self.manual_hidden
         fn = Path(script).with_suffix(PROFILE_SUFFIX)
-        fn.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        data = _dump_profile_json(profile)
+        h = hashlib.blake2b(str(fn).encode("utf-8"), digest_size=16)
+        h.update(data)
+        digest = h.digest()
+        # nur überspringen, wenn auch die Datei seit dem letzten Schreiben unverändert ist
+        # (Handbearbeitung oder zweite GUI-Instanz)
+        last = self._last_profile_write
+        if last is not None and last[0] == digest:
+            try:
+                st = os.stat(fn)
+            except OSError:
+                st = None
+            if st is not None and (st.st_mtime_ns, st.st_size) == last[1:]:
+                self._log(f"Profil unverändert, keine Änderungen zu speichern: {fn}")
+                return
+        _atomic_write_bytes(fn, data)
+        st = os.stat(fn)
+        self._last_profile_write = (digest, st.st_mtime_ns, st.st_size)
         self._log(f"Profil gespeichert: {fn}")
 
     def _load_profile(self):
@@ -878,36 +1343,27 @@ VSVersionInfo(
         if not fn:
             return
         try:
-            profile = json.loads(Path(fn).read_text(encoding="utf-8"))
-            self.script_var.set(profile.get("script", ""))
-            self.name_var.set(profile.get("name", ""))
-            self.icon_var.set(profile.get("icon", ""))
-            self.onefile_var.set(bool(profile.get("onefile", True)))
-            self.windowed_var.set(bool(profile.get("windowed", False)))
-            self.clean_var.set(bool(profile.get("clean", True)))
-            self.scan_all_var.set(bool(profile.get("scan_all", True)))
-            self.auto_data_dirs_var.set(bool(profile.get("auto_data_dirs", True)))
-            self.collect_all_var.set(bool(profile.get("collect_all", True)))
-            self.extra_paths = [Path(p) for p in profile.get("extra_paths", [])]
-            self.manual_datas = [(Path(p), dest) for p, dest in profile.get("manual_datas", [])]
-            self.manual_hidden = list(profile.get("manual_hidden", []))
-
-            # NEW: weitere Felder
-            self.noupx_var.set(bool(profile.get("noupx", True)))
-            self.runtime_tmpdir_var.set(profile.get("runtime_tmpdir", ""))
-
-            m = profile.get("profile_meta", {})
-            self.use_versioninfo_var.set(bool(m.get("use_versioninfo", True)))
-            self.publisher_var.set(m.get("publisher", ""))
-            self.product_var.set(m.get("product", ""))
-            self.version_var.set(m.get("version", "1.0.0"))
-            self.desc_var.set(m.get("description", ""))
-            self.copyright_var.set(m.get("copyright", ""))
-
-            self._analyze()
-            self._refresh_datas_list()
-            self._refresh_paths_list()
-            self._refresh_imports_list()
+            st = os.stat(fn)
+            entry = self._profile_cache.get(fn)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                profile = entry[2]
+            else:
+                profile = _load_profile_json(Path(fn).read_bytes())
+                self._profile_cache[fn] = (st.st_mtime_ns, st.st_size, profile)
+            self._bulk_loading = True
+            try:
+                for section, key, attr, caster, default in self._PROFILE_FIELDS:
+                    source = profile if section is None else profile.get(section, {})
+                    getattr(self, attr).set(caster(source.get(key, default)))
+                self.extra_paths = [Path(p) for p in profile.get("extra_paths", [])]
+                self.manual_datas = [(Path(p), dest) for p, dest in profile.get("manual_datas", [])]
+                self.manual_hidden = list(profile.get("manual_hidden", []))
+
+                self._analyze()
+            finally:
+                self._bulk_loading = False
+            # alle Listen gesammelt in einem Idle-Durchlauf (ein Layout-/Redraw-Zyklus)
+            self.root.after_idle(self._refresh_all)
             self._log(f"Profil geladen: {fn}")
         except Exception as e:
             messagebox.showerror(APP_TITLE, f"Profil konnte nicht geladen werden:\n{e}")